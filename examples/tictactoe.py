@@ -129,18 +129,18 @@ class TicTacToe(flare.Button, label=" "):
 # This is a converter for `hikari.User`. It allows `hikari.User`
 # to be used as a type hint.
 class UserConverter(flare.Converter[hikari.User]):
-    async def to_str(self, obj: hikari.User) -> str:
-        return str(hikari.Snowflake(obj))
+    def to_bytes(self, buf: bytearray, obj: hikari.User) -> None:
+        buf += int(obj.id).to_bytes(8, "little")
 
-    async def from_str(self, obj: str) -> hikari.User:
-        snowflake = hikari.Snowflake(obj)
+    async def from_bytes(self, buf: memoryview, off: int) -> tuple[int, hikari.User]:
+        snowflake = hikari.Snowflake.from_bytes(buf[off : off + 8], "little")
 
         if isinstance(self.app, hikari.traits.CacheAware):
             if user := self.app.cache.get_user(snowflake):
-                return user
+                return off + 8, user
 
         if isinstance(self.app, hikari.traits.RESTAware):
-            return await self.app.rest.fetch_user(snowflake)
+            return off + 8, await self.app.rest.fetch_user(snowflake)
 
         raise Exception("Could not fetch user. Bot is not `RESTAware` and user is not cached.")
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import base64
 import copy
 import hashlib
 import typing as t
@@ -61,7 +62,8 @@ class SupportsCallback(t.Protocol[PartialContextT]):
 
 
 def write_cookie(s: str) -> str:
-    return hashlib.blake2s(s.encode("latin1"), digest_size=8).digest().decode("latin1")
+    # The cookie is ascii so it takes one byte per character when serialized.
+    return base64.b85encode(hashlib.blake2s(s.encode(), digest_size=8).digest()).decode("ascii")
 
 
 class CallbackComponent(
@@ -75,6 +77,8 @@ class CallbackComponent(
     """
 
     _cookie: t.ClassVar[str]
+    _serialized_annotations: t.ClassVar[dict[str, t.Any]]
+    """The types for the fields that are stored in the custom_id."""
 
     def __init_subclass__(
         cls,
@@ -83,6 +87,8 @@ class CallbackComponent(
     ) -> None:
         super().__init_subclass__(_dataclass_fields)
 
+        cls._serialized_annotations = cls._dataclass_annotations
+
         cls._cookie = cookie or write_cookie(f"{cls.__name__}.{cls.__module__}")
 
         bootstrap.components[cls._cookie] = cls
@@ -101,7 +107,7 @@ class CallbackComponent(
 
     async def set_custom_id(self):
         self._custom_id = await bootstrap.active_serde.serialize(
-            self._cookie, self._dataclass_annotations, self._dataclass_values
+            self._cookie, self._serialized_annotations, self._dataclass_values
         )
 
     @property
@@ -31,6 +31,8 @@ class ModalComponent(Component[hikari.api.ModalActionRowBuilder]):
 class Modal(SupportsCallback["ModalContext"], SupportsCookie, t.MutableSequence[ModalComponent], Dataclass):
     __cookie: t.ClassVar[str]
     __title: t.ClassVar[str | None]
+    _serialized_annotations: t.ClassVar[dict[str, t.Any]]
+    """The types for the fields that are stored in the custom_id."""
 
     def __init_subclass__(cls, title: str | None = None, cookie: str | None = None) -> None:
         cls.__title = title
@@ -38,6 +40,11 @@ class Modal(SupportsCallback["ModalContext"], SupportsCookie, t.MutableSequence[
         bootstrap.components[cls.__cookie] = cls
         super().__init_subclass__()
 
+        # `ModalComponent` shouldn't store state so that is removed.
+        cls._serialized_annotations = {
+            k: v for k, v in cls._dataclass_annotations.items() if not utils.any_issubclass(v, ModalComponent)
+        }
+
     def __post_init__(self, _ctx: ModalContext | None = None) -> None:
         self.title = self.__title
 
@@ -101,13 +108,6 @@ class Modal(SupportsCallback["ModalContext"], SupportsCookie, t.MutableSequence[
 
         return out
 
-    def _without_modal_component(self, d: dict[str, t.Any]) -> dict[str, t.Any]:
-        return {
-            k: v
-            for k, v in d.items()
-            if not isinstance(v, ModalComponent) and not utils.any_issubclass(v, ModalComponent)
-        }
-
     async def send(self, inter: hikari.ModalResponseMixin):
         """
         Respond to an iteration with this modal.
@@ -117,9 +117,8 @@ class Modal(SupportsCallback["ModalContext"], SupportsCookie, t.MutableSequence[
 
         custom_id = await bootstrap.active_serde.serialize(
             self.__cookie,
-            # `ModalComponent` shouldn't store state so that is removed.
-            self._without_modal_component(self._dataclass_annotations),
-            self._without_modal_component(self._dataclass_values),
+            self._serialized_annotations,
+            {k: v for k, v in self._dataclass_values.items() if k in self._serialized_annotations},
         )
         await inter.create_modal_response(self.title, custom_id, components=self.build())
 
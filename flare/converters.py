@@ -1,10 +1,11 @@
 import abc
+import collections
 import enum
-import functools
 import inspect
 import struct
 import types
 import typing as t
+import weakref
 
 import hikari.traits
 
@@ -12,6 +13,9 @@ from flare import exceptions
 
 T = t.TypeVar("T")
 
+_U16 = struct.Struct("<H")
+_F64 = struct.Struct("<d")
+
 __all__: t.Final[t.Sequence[str]] = (
     "Converter",
     "add_converter",
@@ -23,7 +27,11 @@ __all__: t.Final[t.Sequence[str]] = (
 
 class Converter(abc.ABC, t.Generic[T]):
     """
-    Converters are used to convert types between a python object and string.
+    Converters are used to convert types between a python object and bytes.
+
+    Converters append their value to a shared buffer and read it back starting
+    at an offset. Both methods may be coroutine functions if the converter has
+    to do IO, such as fetching an object from the API.
 
     .. code-block:: python
 
@@ -31,11 +39,11 @@ class Converter(abc.ABC, t.Generic[T]):
         import hikari
 
         class IntConverter(flare.Converter[int]):
-            async def to_str(self, obj: int) -> str:
-                return str(obj)
+            def to_bytes(self, buf: bytearray, obj: int) -> None:
+                buf += obj.to_bytes(8, "little")
 
-            async def from_str(self, obj: str) -> int:
-                return int(obj)
+            def from_bytes(self, buf: memoryview, off: int) -> tuple[int, int]:
+                return off + 8, int.from_bytes(buf[off : off + 8], "little")
 
         flare.add_converter(int, IntConverter)
 
@@ -55,22 +63,56 @@ class Converter(abc.ABC, t.Generic[T]):
             serialized/deserialized.
     """
 
+    __slots__ = ("type", "__weakref__")
+
     app: t.ClassVar[hikari.traits.EventManagerAware]
 
+    _to_bytes_async: t.ClassVar[bool] = False
+    """If `to_bytes` is a coroutine function."""
+    _from_bytes_async: t.ClassVar[bool] = False
+    """If `from_bytes` is a coroutine function."""
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._to_bytes_async = inspect.iscoroutinefunction(cls.to_bytes)
+        cls._from_bytes_async = inspect.iscoroutinefunction(cls.from_bytes)
+
     def __init__(self, type: T) -> None:
         super().__init__()
         self.type = type
 
     @abc.abstractmethod
-    async def to_str(self, obj: T) -> str:
-        ...
+    def to_bytes(self, buf: bytearray, obj: T) -> None | t.Awaitable[None]:
+        """
+        Append `obj` to the end of `buf`.
+        """
 
     @abc.abstractmethod
-    async def from_str(self, obj: str) -> T:
-        ...
-
-
-_converters: dict[t.Any, tuple[type[Converter[t.Any]], bool]] = {}
+    def from_bytes(self, buf: memoryview, off: int) -> tuple[int, T] | t.Awaitable[tuple[int, T]]:
+        """
+        Read an object from `buf` starting at index `off`.
+
+        Returns:
+            The index of the first byte after the object and the object.
+        """
+
+
+_converters: dict[t.Any, Converter[t.Any]] = {}
+"""Mapping of types to the converter instance for that type."""
+_subclass_converters: dict[t.Any, type[Converter[t.Any]]] = {}
+"""Mapping of types to the converter used for their subclasses."""
+_converter_instance_cache: weakref.WeakValueDictionary[t.Any, Converter[t.Any]] = weakref.WeakValueDictionary()
+"""
+Cache of type hints to converters. Converters for registered types are kept alive by `_converters`, other
+entries are dropped once nothing else references the converter, so the type hint can be garbage collected.
+"""
+_recent_converters: collections.deque[Converter[t.Any]] = collections.deque(maxlen=128)
+"""
+The most recently resolved converters. Keeps converters for unregistered type hints, such as subclasses of
+registered types, in `_converter_instance_cache` while they are in use without keeping every type hint alive.
+"""
+_generation: int = 0
+"""Incremented every time a converter is added, so caches of converters elsewhere can be invalidated."""
 
 
 def add_converter(t: t.Any, converter: type[Converter[t.Any]], *, supports_subclass: bool = False) -> None:
@@ -85,14 +127,22 @@ def add_converter(t: t.Any, converter: type[Converter[t.Any]], *, supports_subcl
         supports_subclass:
             If `True`, this converter will be used for subclasses of `t`.
     """
-    _converters[t] = (converter, supports_subclass)
-    get_converter.cache_clear()
+    global _generation
 
+    _converters[t] = converter(t)
+    if supports_subclass:
+        _subclass_converters[t] = converter
+    else:
+        _subclass_converters.pop(t, None)
+    _converter_instance_cache.clear()
+    _recent_converters.clear()
+    _generation += 1
 
-def _any_issubclass(t: t.Any, cls: t.Any) -> bool:
-    if not inspect.isclass(t):
-        return False
-    return issubclass(t, cls)
+    if t is int:
+        # Enums are stored with the converter for their int values, so they are async if it is.
+        EnumConverter._int_converter = _converters[int]
+        EnumConverter._to_bytes_async = _converters[int]._to_bytes_async
+        EnumConverter._from_bytes_async = _converters[int]._from_bytes_async
 
 
 def _is_union(obj: t.Any) -> bool:
@@ -106,67 +156,104 @@ def _get_left(obj: t.Any) -> t.Any:
     return t.get_args(obj)[0]
 
 
-@functools.lru_cache(maxsize=128)
 def get_converter(type_: t.Any) -> Converter[t.Any]:
     """
     Return the converter used for a certain type hint. If a Union is passed,
     the left side of the Union will be used to find the converter.
     """
-    origin = _get_left(type_)
+    converter = _converter_instance_cache.get(type_)
+    if converter is None:
+        converter = _converter_instance_cache[type_] = _resolve_converter(type_)
+        _recent_converters.append(converter)
+    return converter
 
-    if origin_ := t.get_origin(origin):
-        origin = origin_
 
-    if origin in _converters:
-        converter, _ = _converters[origin]
-        return converter(origin)
+def _resolve_converter(type_: t.Any) -> Converter[t.Any]:
+    # Plain classes such as `int` can not be a Union or have an origin.
+    if type(type_) is type:
+        origin = type_
     else:
-        for k, (converter, supports_subclass) in _converters.items():
-            if supports_subclass and _any_issubclass(origin, k):
+        origin = _get_left(type_)
+
+        if origin_ := t.get_origin(origin):
+            origin = origin_
+
+    if origin in _converters:
+        return _converters[origin]
+    elif inspect.isclass(origin):
+        for base in origin.__mro__:
+            if converter := _subclass_converters.get(base):
                 return converter(origin)
 
     raise exceptions.ConverterError(f"Could not find converter for type `{getattr(type_, '__name__', type_)}`.")
 
 
 class IntConverter(Converter[int]):
-    async def to_str(self, obj: int) -> str:
-        byte_length = obj.bit_length() // 8 + 1
-        return obj.to_bytes(byte_length, "little").decode("latin1")
+    __slots__ = ()
+
+    def to_bytes(self, buf: bytearray, obj: int) -> None:
+        # One extra bit is needed for the sign.
+        byte_length = (obj.bit_length() + 8) >> 3
+        buf.append(byte_length)
+        buf += obj.to_bytes(byte_length, "little", signed=True)
 
-    async def from_str(self, obj: str) -> int:
-        return self.type.from_bytes(obj.encode("latin1"), "little")
+    def from_bytes(self, buf: memoryview, off: int) -> tuple[int, int]:
+        end = off + 1 + buf[off]
+        return end, self.type.from_bytes(buf[off + 1 : end], "little", signed=True)
 
 
 class FloatConverter(Converter[float]):
-    async def to_str(self, obj: float) -> str:
-        return struct.pack("d", obj).decode("latin1")
+    __slots__ = ()
+
+    def to_bytes(self, buf: bytearray, obj: float) -> None:
+        buf += _F64.pack(obj)
 
-    async def from_str(self, obj: str) -> float:
-        return struct.unpack("d", obj.encode("latin1"))[0]
+    def from_bytes(self, buf: memoryview, off: int) -> tuple[int, float]:
+        return off + 8, _F64.unpack_from(buf, off)[0]
 
 
 class StringConverter(Converter[str]):
-    async def to_str(self, obj: str) -> str:
-        return obj
+    __slots__ = ()
 
-    async def from_str(self, obj: str) -> str:
-        return obj
+    def to_bytes(self, buf: bytearray, obj: str) -> None:
+        data = obj.encode()
+        buf += _U16.pack(len(data))
+        buf += data
+
+    def from_bytes(self, buf: memoryview, off: int) -> tuple[int, str]:
+        end = off + 2 + _U16.unpack_from(buf, off)[0]
+        return end, str(buf[off + 2 : end], "utf-8")
 
 
 class EnumConverter(Converter[enum.Enum]):
-    async def to_str(self, obj: enum.Enum) -> str:
-        return await get_converter(int).to_str(obj.value)
+    __slots__ = ()
+
+    _int_converter: t.ClassVar[Converter[int]]
+    """The converter used for enum values. Set by `add_converter` when a converter for `int` is added."""
+
+    def to_bytes(self, buf: bytearray, obj: enum.Enum) -> None | t.Awaitable[None]:
+        return self._int_converter.to_bytes(buf, obj.value)
 
-    async def from_str(self, obj: str) -> enum.Enum:
-        return self.type(get_converter(int).from_str(obj))  # type: ignore
+    def from_bytes(self, buf: memoryview, off: int) -> tuple[int, enum.Enum] | t.Awaitable[tuple[int, enum.Enum]]:
+        if self._from_bytes_async:
+            return self._from_bytes_async_impl(buf, off)
+        off, value = t.cast("tuple[int, int]", self._int_converter.from_bytes(buf, off))
+        return off, self.type(value)  # type: ignore
+
+    async def _from_bytes_async_impl(self, buf: memoryview, off: int) -> tuple[int, enum.Enum]:
+        off, value = await t.cast("t.Awaitable[tuple[int, int]]", self._int_converter.from_bytes(buf, off))
+        return off, self.type(value)  # type: ignore
 
 
 class BoolConverter(Converter[bool]):
-    async def to_str(self, obj: bool) -> str:
-        return "1" if obj else "0"
+    __slots__ = ()
+
+    def to_bytes(self, buf: bytearray, obj: bool) -> None:
+        # `bool` is a subclass of `int`, so it can be appended as 0 or 1.
+        buf.append(bool(obj))
 
-    async def from_str(self, obj: str) -> bool:
-        return bool(int(obj))
+    def from_bytes(self, buf: memoryview, off: int) -> tuple[int, bool]:
+        return off + 1, bool(buf[off])
 
 
 add_converter(float, FloatConverter, supports_subclass=True)
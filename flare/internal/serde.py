@@ -1,17 +1,137 @@
 from __future__ import annotations
 
 import abc
+import base64
+import struct
 import typing as t
 
-from flare.converters import get_converter
+from flare import converters
+from flare.converters import (
+    _F64,
+    _U16,
+    BoolConverter,
+    Converter,
+    FloatConverter,
+    IntConverter,
+    StringConverter,
+    get_converter,
+)
 from flare.exceptions import SerializerError, SerializerVersionViolation
-from flare.utils import gather_iter
 
 if t.TYPE_CHECKING:
     from flare.components import base
 
 __all__: t.Final[t.Sequence[str]] = ("Serde",)
 
+_Fields = tuple[tuple[str, Converter[t.Any]], ...]
+_Serializer = t.Callable[[bytearray, dict[str, t.Any]], None]
+_Deserializer = t.Callable[[memoryview, int], dict[str, t.Any]]
+
+
+def _get_fields(types: dict[str, t.Any]) -> _Fields:
+    return tuple((k, get_converter(v)) for k, v in types.items())
+
+
+def _encode_cookie(cookie: str) -> bytes:
+    encoded = cookie.encode()
+    if len(encoded) > 255:
+        raise SerializerError(f"The cookie for component {cookie} is too long.")
+    return len(encoded).to_bytes(1, "little") + encoded
+
+
+def _make_serializer(cookie: str, fields: _Fields) -> _Serializer | None:
+    """
+    Generate a function that writes the cookie and fields of a component to a
+    buffer. `None` is returned if any of the converters are async.
+    """
+    if any(converter._to_bytes_async for _, converter in fields):
+        return None
+
+    namespace: dict[str, t.Any] = {"cookie": _encode_cookie(cookie)}
+    lines = ["def serialize(buf, kwargs):", "    buf += cookie"]
+    nulls: list[str] = []
+
+    for i, (k, converter) in enumerate(fields):
+        namespace[f"to_bytes_{i}"] = converter.to_bytes
+        lines.append(f"    val_{i} = kwargs.get({k!r})")
+        nulls.append(f"(val_{i} is None) << {i}")
+
+    lines.append(f"    buf += ({' | '.join(nulls) or '0'}).to_bytes({(len(fields) + 7) // 8}, 'little')")
+
+    for i in range(len(fields)):
+        lines.append(f"    if val_{i} is not None:")
+        lines.append(f"        to_bytes_{i}(buf, val_{i})")
+
+    exec("\n".join(lines), namespace)
+    return namespace["serialize"]
+
+
+_INLINE_FROM_BYTES: dict[type[Converter[t.Any]], tuple[str, ...]] = {
+    IntConverter: (
+        "end = off + 1 + buf[off]",
+        "val_{i} = type_{i}.from_bytes(buf[off + 1 : end], 'little', signed=True)",
+        "off = end",
+    ),
+    FloatConverter: (
+        "val_{i} = unpack_f64(buf, off)[0]",
+        "off += 8",
+    ),
+    StringConverter: (
+        "end = off + 2 + unpack_u16(buf, off)[0]",
+        "val_{i} = str(buf[off + 2 : end], 'utf-8')",
+        "off = end",
+    ),
+    BoolConverter: (
+        "val_{i} = bool(buf[off])",
+        "off += 1",
+    ),
+}
+"""
+Source for the `from_bytes` method of built in converters. These are inlined
+into generated deserializers to avoid a function call per field.
+"""
+
+
+def _make_deserializer(fields: _Fields) -> _Deserializer | None:
+    """
+    Generate a function that reads the fields of a component from a buffer,
+    starting at the null bitfield. `None` is returned if any of the converters
+    are async.
+    """
+    if any(converter._from_bytes_async for _, converter in fields):
+        return None
+
+    namespace: dict[str, t.Any] = {"unpack_f64": _F64.unpack_from, "unpack_u16": _U16.unpack_from}
+    nulls_length = (len(fields) + 7) // 8
+    lines = [
+        "def deserialize(buf, off):",
+        f"    nulls = int.from_bytes(buf[off : off + {nulls_length}], 'little')",
+        f"    off += {nulls_length}",
+    ]
+    # The args are returned as a single dict display.
+    items: list[str] = []
+
+    for i, (k, converter) in enumerate(fields):
+        lines.append(f"    if nulls >> {i} & 1:")
+        lines.append(f"        val_{i} = None")
+        lines.append("    else:")
+
+        if inline := _INLINE_FROM_BYTES.get(type(converter)):
+            namespace[f"type_{i}"] = converter.type
+            lines.extend(f"        {line.format(i=i)}" for line in inline)
+        else:
+            namespace[f"from_bytes_{i}"] = converter.from_bytes
+            lines.append(f"        off, val_{i} = from_bytes_{i}(buf, off)")
+
+        items.append(f"{k!r}: val_{i}")
+
+    lines.append("    if off != len(buf):")
+    lines.append("        raise ValueError('Buffer length does not match the fields.')")
+    lines.append(f"    return {{{', '.join(items)}}}")
+
+    exec("\n".join(lines), namespace)
+    return namespace["deserialize"]
+
 
 class SerdeABC(abc.ABC):
     """Abstract class for implementing a custom serializer and deserializer."""
@@ -50,63 +170,49 @@ class Serde(SerdeABC):
     """
     A class that handles serialization and deserialization of component custom_id encoded data.
 
+    Every field is written into a single buffer by its converter. The buffer is
+    base85 encoded once all fields are written.
+
+    The buffer is laid out as follows:
+
+    - The version, one byte. Omitted if `version` is `None`.
+    - The increment, `increment_length` bytes.
+    - The length of the cookie, one byte, followed by the UTF-8 encoded cookie.
+    - A bitfield of the fields that are `None`, one bit per field.
+    - Each field that is not `None`, in the order they are defined.
+
+    If none of a component's converters are async, a function to serialize and
+    deserialize the component is generated the first time it is used. These are
+    regenerated if a converter is added afterwards.
+
     For simple behaviour changes it may be sufficient to subclass this class, but if you desire to completely
     overhaul serialization and deserialization, you may wish to only subclass SerdeABC instead.
 
     Args:
-        sep:
-            The character used to serperate fields.
-        null:
-            The character used to signify `None`.
-        esc:
-            The escape character.
         increment_length:
             `increment` is a unique number to allow buttons for the same values in the same
             message. `increment_length` can be set to `0` if identical buttons are never used
             in the same message.
         version:
-            The serializer version number.
+            The serializer version number. Must fit in a single byte.
     """
 
     def __init__(
         self,
-        sep: str = "\x81",
-        null: str = "\x82",
-        esc: str = "\\",
         increment_length: int = 3,
-        version: int | None = 0,
+        version: int | None = 1,
     ) -> None:
-        self._SEP: str = sep
-        self._ESC: str = esc
-        self._NULL: str = null
         self._VER: int | None = version
 
         self._increment_length = increment_length
         self._increment = 0
 
-        if len(sep) != 1:
-            raise ValueError("Separator must be a single character.")
-
-        if len(null) != 1:
-            raise ValueError("Null must be a single character.")
-
-        if len(esc) != 1:
-            raise ValueError("Escape must be a single character.")
-
-    @property
-    def SEP(self) -> str:
-        """The separator used to separate arguments."""
-        return self._SEP
-
-    @property
-    def ESC(self) -> str:
-        """The escape character."""
-        return self._ESC
+        self._serializers: dict[str, tuple[_Fields, _Serializer | None]] = {}
+        self._deserializers: dict[str, tuple[_Fields, _Deserializer | None]] = {}
+        self._converters_generation: int = converters._generation
 
-    @property
-    def NULL(self) -> str:
-        """Character used to represent a missing value."""
-        return self._NULL
+        if version is not None and not 0 <= version <= 255:
+            raise ValueError("Version must be between 0 and 255.")
 
     @property
     def VER(self) -> int | None:
@@ -116,139 +222,151 @@ class Serde(SerdeABC):
         """
         return self._VER
 
-    def get_inc(self) -> str:
+    def get_inc(self) -> bytes:
         self._increment += 1
         if self._increment > 2**self._increment_length - 1:
             self._increment = 0
 
-        return self._increment.to_bytes(self._increment_length, "little").decode("latin1")
-
-    def escape(self, string: str) -> str:
-        """Escape a string using `self.ESC`, `self.NULL` and `self.SEP`."""
-        out: list[str] = []
-        for char in string:
-            if char in [self.ESC, self.NULL, self.SEP]:
-                out.append(f"{self.ESC}{char}")
-            else:
-                out.append(char)
-        return "".join(out)
+        return self._increment.to_bytes(self._increment_length, "little")
 
-    def unescape(self, string: str) -> list[tuple[str, bool]]:
-        """Returns a list of tuples signifying (the character, whether it was escaped)"""
-        out: list[tuple[str, bool]] = []
-        last_was_esc = False
+    def _check_converters(self) -> None:
+        # The cached fields and generated functions hold the converters they were built with.
+        if self._converters_generation != converters._generation:
+            self._serializers.clear()
+            self._deserializers.clear()
+            self._converters_generation = converters._generation
 
-        for char in string:
-            if not last_was_esc and char != self.ESC:
-                out.append((char, False))
-                continue
-
-            if last_was_esc:
-                out.append((char, True))
-                last_was_esc = False
-                continue
+    async def serialize(self, cookie: str, types: dict[str, t.Any], kwargs: dict[str, t.Any]) -> str:
+        self._check_converters()
 
-            last_was_esc = True
+        buf = bytearray()
 
-        return out
+        if self.VER is not None:
+            buf.append(self.VER)
 
-    async def serialize(self, cookie: str, types: dict[str, t.Any], kwargs: dict[str, t.Any]) -> str:
-        version = "" if self.VER is None else await get_converter(int).to_str(self.VER)
+        buf += self.get_inc()
 
-        async def serialize_one(k: str, v: t.Any) -> str:
-            val = kwargs.get(k)
-            converter = get_converter(v)
-            return self.escape(await converter.to_str(val)) if val is not None else self.NULL
+        try:
+            fields, serializer = self._serializers[cookie]
+        except KeyError:
+            fields = _get_fields(types)
+            serializer = _make_serializer(cookie, fields)
+            self._serializers[cookie] = (fields, serializer)
 
-        out = self.SEP.join(
-            (
-                f"{version}{self.get_inc()}{self.escape(cookie)}",
-                *await gather_iter(serialize_one(k, v) for k, v in types.items()),
-            )
-        )
+        try:
+            if serializer:
+                serializer(buf, kwargs)
+            else:
+                await self._serialize_fields(buf, cookie, fields, kwargs)
+        # Built in converters raise these when a value does not fit in its length prefix.
+        except (ValueError, OverflowError, struct.error) as e:
+            raise SerializerError(
+                f"The serialized custom_id for component {cookie} may be too long."
+                " Try reducing the size of the values the component stores."
+            ) from e
 
-        if len(out) > 100:
+        # Base85 encodes every 4 bytes as 5 characters, so 80 bytes fit in 100 characters.
+        if len(buf) > 80:
             raise SerializerError(
                 f"The serialized custom_id for component {cookie} may be too long."
                 " Try reducing the number of parameters the component takes."
-                f" Got length: {len(out)} Expected length: 100 or less"
+                f" Got length: {len(buf) + -(-len(buf) // 4)} Expected length: 100 or less"
             )
-        return out
 
-    def split_on_sep(self, string: list[tuple[str, bool]]) -> list[list[tuple[str, bool]]]:
-        """Split the provided string on the separator, but ignore separators that are escaped.
+        return base64.b85encode(buf).decode("ascii")
 
-        Args:
-            string:
-                The provided string.
+    async def _serialize_fields(self, buf: bytearray, cookie: str, fields: _Fields, kwargs: dict[str, t.Any]) -> None:
+        buf += _encode_cookie(cookie)
 
-        Returns:
-            list[str]
-                The split string.
-        """
-        out: list[list[tuple[str, bool]]] = [[]]
+        nulls = 0
+        for i, (k, _) in enumerate(fields):
+            if kwargs.get(k) is None:
+                nulls |= 1 << i
+        buf += nulls.to_bytes((len(fields) + 7) // 8, "little")
 
-        for char, is_escaped in string:
-            if char == self.SEP and not is_escaped:
-                out.append([])
+        for k, converter in fields:
+            val = kwargs.get(k)
+            if val is None:
+                continue
+            if converter._to_bytes_async:
+                await t.cast("t.Awaitable[None]", converter.to_bytes(buf, val))
             else:
-                out[-1].append((char, is_escaped))
-
-        return out
+                converter.to_bytes(buf, val)
 
-    @staticmethod
-    def tuple_list_to_string(string: list[tuple[str, bool]]) -> str:
-        """Conbine a list of tuples into a string, ignoring the second value."""
-        out: list[str] = []
-        for char, _ in string:
-            out.append(char)
-        return "".join(out)
+    async def _deserialize_fields(self, buf: memoryview, off: int, fields: _Fields) -> dict[str, t.Any]:
+        nulls_end = off + (len(fields) + 7) // 8
+        nulls = int.from_bytes(buf[off:nulls_end], "little")
+        off = nulls_end
 
-    async def cast_kwargs(self, kwargs: dict[str, t.Any], types: dict[str, t.Any]) -> dict[str, t.Any]:
-        ret: dict[str, t.Any] = {}
+        transformed_args: dict[str, t.Any] = {}
 
-        async def convert_one(k: str, v: t.Any) -> None:
-            if v is None:
-                ret[k] = None
-                return
-            cast_to = types[k]
-            ret[k] = await get_converter(cast_to).from_str(v)
+        for i, (k, converter) in enumerate(fields):
+            if nulls >> i & 1:
+                transformed_args[k] = None
+            elif converter._from_bytes_async:
+                off, transformed_args[k] = await t.cast(
+                    "t.Awaitable[tuple[int, t.Any]]", converter.from_bytes(buf, off)
+                )
+            else:
+                off, transformed_args[k] = t.cast("tuple[int, t.Any]", converter.from_bytes(buf, off))
 
-        await gather_iter(convert_one(k, v) for k, v in kwargs.items())
+        if off != len(buf):
+            raise ValueError("Buffer length does not match the fields.")
 
-        return ret
+        return transformed_args
 
     async def deserialize(
         self, custom_id: str, map: dict[str, t.Any]
     ) -> tuple[type[base.SupportsCallback[t.Any]], dict[str, t.Any]]:
+        try:
+            buf = memoryview(base64.b85decode(custom_id))
+        except ValueError as e:
+            raise SerializerError(f"Could not decode custom_id {custom_id}.") from e
+
+        off = 0
+
         if self.VER is not None:  # Allow for no version to disable verification
-            version = await get_converter(int).from_str(custom_id[0])
+            version = buf[0] if buf else None
 
             if version != self.VER:
                 raise SerializerVersionViolation(
                     f"Serializer {self.__class__.__name__} cannot deserialize version {version}."
                 )
 
-            custom_id = custom_id[1:]
+            off += 1
+
+        off += self._increment_length
 
-        custom_id = custom_id[self._increment_length :]
+        if off >= len(buf):
+            raise SerializerError(f"custom_id {custom_id} is too short.")
 
-        cookie, *args = self.split_on_sep(self.unescape(custom_id))
+        cookie_end = off + 1 + buf[off]
 
-        component_ = map.get(self.tuple_list_to_string(cookie))
+        try:
+            cookie = str(buf[off + 1 : cookie_end], "utf-8")
+        except UnicodeDecodeError as e:
+            raise SerializerError(f"Could not decode the cookie of custom_id {custom_id}.") from e
+
+        component_ = map.get(cookie)
 
         if component_ is None:
             raise SerializerError(f"Component with cookie {cookie} does not exist.")
 
-        types = component_._dataclass_annotations
+        self._check_converters()
 
-        transformed_args: dict[str, t.Any] = {}
+        try:
+            fields, deserializer = self._deserializers[cookie]
+        except KeyError:
+            fields = _get_fields(component_._serialized_annotations)
+            deserializer = _make_deserializer(fields)
+            self._deserializers[cookie] = (fields, deserializer)
 
-        for k, arg in zip(types.keys(), args):
-            if len(arg) == 1:
-                if arg[0] == (self.NULL, False):
-                    transformed_args[k] = None
-                    continue
-            transformed_args[k] = self.tuple_list_to_string(arg)
+        try:
+            if deserializer:
+                transformed_args = deserializer(buf, cookie_end)
+            else:
+                transformed_args = await self._deserialize_fields(buf, cookie_end, fields)
+        except (IndexError, ValueError, struct.error) as e:
+            raise SerializerError(f"Could not deserialize the fields of component {cookie}.") from e
 
-        return (component_, await self.cast_kwargs(transformed_args, types))
+        return (component_, transformed_args)
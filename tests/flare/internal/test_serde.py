@@ -0,0 +1,211 @@
+import asyncio
+import enum
+import typing
+
+import pytest
+
+import flare
+from flare import converters
+from flare.converters import Converter, add_converter, get_converter
+from flare.exceptions import SerializerError
+from flare.internal import bootstrap
+from flare.internal.serde import Serde
+
+
+class Color(enum.Enum):
+    RED = 1
+    BLUE = 300
+
+
+class Id(int):
+    ...
+
+
+class Component:
+    _serialized_annotations: typing.ClassVar[dict[str, typing.Any]] = {
+        "a": int,
+        "b": str,
+        "c": float | None,
+        "d": bool,
+        "e": Color,
+        "f": Id,
+    }
+
+
+class Point(typing.NamedTuple):
+    x: int
+    y: int
+
+
+class PointConverter(Converter[Point]):
+    async def to_bytes(self, buf: bytearray, obj: Point) -> None:
+        buf += bytes(obj)
+
+    async def from_bytes(self, buf: memoryview, off: int) -> tuple[int, Point]:
+        return off + 2, Point(buf[off], buf[off + 1])
+
+
+@pytest.fixture
+def register_converter() -> typing.Iterator[typing.Callable[[typing.Any, type[Converter[typing.Any]]], None]]:
+    """Add converters for the duration of a test, removing them from the registry afterwards."""
+    added: list[typing.Any] = []
+
+    def register(t: typing.Any, converter: type[Converter[typing.Any]]) -> None:
+        add_converter(t, converter)
+        added.append(t)
+
+    yield register
+
+    for t in added:
+        converters._converters.pop(t, None)
+        converters._subclass_converters.pop(t, None)
+    converters._converter_instance_cache.clear()
+    converters._recent_converters.clear()
+
+
+class AsyncComponent:
+    _serialized_annotations: typing.ClassVar[dict[str, typing.Any]] = {"a": int, "point": Point}
+
+
+def roundtrip(kwargs: dict[str, typing.Any], component: typing.Any = Component) -> dict[str, typing.Any]:
+    serde = Serde()
+
+    async def inner():
+        custom_id = await serde.serialize("cookie", component._serialized_annotations, kwargs)
+        return await serde.deserialize(custom_id, {"cookie": component})
+
+    component_, out = asyncio.run(inner())
+    assert component_ is component
+    return out
+
+
+def test_roundtrip():
+    kwargs = {"a": -12345, "b": "héllo", "c": 1.5, "d": True, "e": Color.BLUE, "f": Id(2**40)}
+    out = roundtrip(kwargs)
+    assert out == kwargs
+    assert type(out["f"]) is Id
+
+
+def test_roundtrip_none():
+    kwargs = {"a": 0, "b": "", "c": None, "d": False, "e": Color.RED, "f": None}
+    assert roundtrip(kwargs) == kwargs
+
+
+def test_roundtrip_async_converter(register_converter: typing.Callable[..., None]):
+    register_converter(Point, PointConverter)
+    kwargs = {"a": 7, "point": Point(3, 4)}
+    assert roundtrip(kwargs, AsyncComponent) == kwargs
+
+
+class StateModal(flare.Modal, title="Modal"):
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+    f: int
+    g: int
+    h: int
+
+    text_input: flare.TextInput = flare.TextInput(label="Row 1")
+
+
+def test_roundtrip_modal():
+    serde = Serde()
+    modal = StateModal(9, 1, 2, 3, 4, 5, 6, 7)
+
+    async def inner():
+        custom_id = await serde.serialize(modal.cookie, modal._serialized_annotations, modal._dataclass_values)
+        return await serde.deserialize(custom_id, bootstrap.components)
+
+    component, out = asyncio.run(inner())
+    assert component is StateModal
+    assert out == {"a": 9, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5, "g": 6, "h": 7}
+
+
+class Tag(str):
+    ...
+
+
+class UpperTagConverter(Converter[Tag]):
+    def to_bytes(self, buf: bytearray, obj: Tag) -> None:
+        get_converter(str).to_bytes(buf, obj.upper())
+
+    def from_bytes(self, buf: memoryview, off: int) -> tuple[int, Tag]:
+        off, value = typing.cast("tuple[int, str]", get_converter(str).from_bytes(buf, off))
+        return off, Tag(value)
+
+
+class TagComponent:
+    _serialized_annotations: typing.ClassVar[dict[str, typing.Any]] = {"tag": Tag}
+
+
+def test_converter_added_after_first_use(register_converter: typing.Callable[..., None]):
+    serde = Serde()
+
+    async def inner():
+        custom_id = await serde.serialize("tag", TagComponent._serialized_annotations, {"tag": Tag("a")})
+        return await serde.deserialize(custom_id, {"tag": TagComponent})
+
+    assert asyncio.run(inner())[1] == {"tag": "a"}
+    register_converter(Tag, UpperTagConverter)
+    assert asyncio.run(inner())[1] == {"tag": "A"}
+
+
+def test_deserialize_invalid():
+    serde = Serde()
+
+    async def inner(custom_id: str):
+        await serde.deserialize(custom_id, {"cookie": Component})
+
+    valid = asyncio.run(serde.serialize("cookie", Component._serialized_annotations, {"a": 1}))
+
+    for custom_id in ("", "a", "0000", valid[:-5], valid + "00000"):
+        with pytest.raises(SerializerError):
+            asyncio.run(inner(custom_id))
+
+
+def test_serialize_too_long():
+    serde = Serde()
+
+    async def inner():
+        await serde.serialize("cookie", {"a": str}, {"a": "a" * 100})
+
+    with pytest.raises(SerializerError):
+        asyncio.run(inner())
+
+
+def test_serialize_value_too_large():
+    serde = Serde()
+
+    async def inner(cookie: str, types: dict[str, typing.Any], kwargs: dict[str, typing.Any]):
+        await serde.serialize(cookie, types, kwargs)
+
+    with pytest.raises(SerializerError):
+        asyncio.run(inner("str", {"a": str}, {"a": "a" * 70000}))
+
+    with pytest.raises(SerializerError):
+        asyncio.run(inner("int", {"a": int}, {"a": 2**2100}))
+
+
+# MIT License
+#
+# Copyright (c) 2022-present Lunarmagpie
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
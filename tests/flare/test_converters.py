@@ -1,6 +1,24 @@
+import asyncio
+import enum
+import gc
 import typing
+import weakref
 
-from flare.converters import _get_left, _is_union
+import pytest
+
+from flare.converters import (
+    BoolConverter,
+    Converter,
+    EnumConverter,
+    IntConverter,
+    StringConverter,
+    _converter_instance_cache,
+    _get_left,
+    _is_union,
+    _recent_converters,
+    add_converter,
+    get_converter,
+)
 
 
 def test_get_left():
@@ -14,6 +32,109 @@ def test_is_union():
     assert not _is_union(int)
 
 
+def test_subclass_converters():
+    class Number(enum.IntEnum):
+        ONE = 1
+
+    class Letter(str, enum.Enum):
+        A = "a"
+
+    class Flag(enum.Enum):
+        ON = 1
+
+    class Id(int):
+        ...
+
+    assert isinstance(get_converter(Number), IntConverter)
+    assert isinstance(get_converter(Letter), StringConverter)
+    assert isinstance(get_converter(Flag), EnumConverter)
+    assert isinstance(get_converter(bool), BoolConverter)
+
+    converter = get_converter(Id)
+    assert isinstance(converter, IntConverter)
+    assert converter.type is Id
+
+
+class AsyncIntConverter(Converter[int]):
+    async def to_bytes(self, buf: bytearray, obj: int) -> None:
+        buf += obj.to_bytes(8, "little")
+
+    async def from_bytes(self, buf: memoryview, off: int) -> tuple[int, int]:
+        return off + 8, int.from_bytes(buf[off : off + 8], "little")
+
+
+@pytest.fixture
+def async_int_converter():
+    add_converter(int, AsyncIntConverter)
+    yield
+    add_converter(int, IntConverter, supports_subclass=True)
+
+
+def test_enum_converter_uses_added_int_converter(async_int_converter: None):
+    class Color(enum.Enum):
+        RED = 300
+
+    converter = get_converter(Color)
+    assert converter._to_bytes_async and converter._from_bytes_async
+
+    async def inner():
+        buf = bytearray()
+        await converter.to_bytes(buf, Color.RED)
+        assert len(buf) == 8
+        return await converter.from_bytes(memoryview(buf), 0)
+
+    assert asyncio.run(inner()) == (8, Color.RED)
+
+
+def test_int_converter():
+    converter = get_converter(int)
+    for value in (0, 1, -1, 127, 128, -128, -129, 255, 256, 2**63, -(2**63)):
+        buf = bytearray()
+        converter.to_bytes(buf, value)
+        assert converter.from_bytes(memoryview(buf), 0) == (len(buf), value)
+
+
+def test_string_converter():
+    converter = get_converter(str)
+    for value in ("", "a", "héllo", "a" * 300, "é" * 150):
+        buf = bytearray()
+        converter.to_bytes(buf, value)
+        assert converter.from_bytes(memoryview(buf), 0) == (len(buf), value)
+
+
+def test_bool_converter():
+    converter = get_converter(bool)
+    for value, expected in ((True, True), (False, False), ("yes", True), ("", False), (2, True), (300, True)):
+        buf = bytearray()
+        converter.to_bytes(buf, value)
+        assert buf in (b"\x00", b"\x01")
+        assert converter.from_bytes(memoryview(buf), 0) == (1, expected)
+
+
+def test_converter_cache_keeps_subclass_converters():
+    class Color(enum.Enum):
+        RED = 1
+
+    assert get_converter(Color) is get_converter(Color)
+
+
+def test_converter_cache_does_not_keep_types_alive():
+    class Color(enum.Enum):
+        RED = 1
+
+    converter = get_converter(Color)
+    assert _converter_instance_cache[Color] is converter
+
+    ref = weakref.ref(Color)
+    del converter, Color
+    # Push the converter out of the recently resolved converters.
+    for i in range(_recent_converters.maxlen or 0):
+        get_converter(enum.IntEnum(f"Filler{i}", "A"))
+    gc.collect()
+
+    assert ref() is None
+
+
 # MIT License
 #
 # Copyright (c) 2022-present Lunarmagpie